@@ -16,15 +16,26 @@ All other behaviour unchanged.
 
 from __future__ import annotations
 
-import glob
-import json
+import atexit
+import functools
+import gzip
 import os
+import threading
 import time
-from datetime import datetime
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
 from urllib.parse import quote
 
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process file locks, run a single process
+    fcntl = None
+
+import orjson
 import requests
-from flask import Flask, Response, jsonify, render_template_string, request
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from flask import Flask, Response, request
 
 app = Flask(__name__)  # Flask serves files under /static automatically
 
@@ -40,9 +51,17 @@ INVENTORY: dict[str, int] = {
 }
 
 SNAPSHOT_DIR   = "snapshots"  
+HISTORY_LOG = os.path.join(SNAPSHOT_DIR, "history.jsonl")  # one {ts, grand_total} per line
 CACHE_FILE = "price_cache.json"
 CACHE_TTL = 3600  # seconds
-SNAPSHOT_GLOB  = os.path.join(SNAPSHOT_DIR, "csgo_snapshot_*.json")
+CACHE_FLUSH_INTERVAL = 5  # seconds between price_cache.json writes
+CACHE_STALE_FACTOR = 4  # stale entries up to CACHE_TTL * this are served while refreshing
+STEAM_COOLDOWN = 60  # seconds to back off after a 429 without Retry-After
+API_CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=3600"
+STATIC_MAX_AGE = 7 * 24 * 3600  # seconds; static files are not fingerprinted
+
+# Only applied to files actually sent from /static, not to 404s.
+app.config["SEND_FILE_MAX_AGE_DEFAULT"] = STATIC_MAX_AGE
 
 # Static KPI values (EUR)
 INVESTED_EUR = 269.56
@@ -53,86 +72,435 @@ REALIZED_EUR = 3935.02
 def _load_cache() -> dict:
     if os.path.exists(CACHE_FILE):
         try:
-            with open(CACHE_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(CACHE_FILE, "rb") as f:
+                return orjson.loads(f.read())
         except Exception:
             pass
     return {}
 
 
-def _save_cache(cache: dict) -> None:
-    tmp = f"{CACHE_FILE}.tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(cache, f, ensure_ascii=False, indent=2)
-    os.replace(tmp, CACHE_FILE)
+# The price cache lives in memory; price_cache.json is only read at startup
+# and rewritten (debounced) after entries changed.
+_CACHE: dict = _load_cache()
+_CACHE_LOCK = threading.Lock()
+_FLUSH_LOCK = threading.Lock()  # serializes writes of CACHE_FILE
+_cache_dirty = False
+_cache_last_write = 0.0
+_flush_timer: threading.Timer | None = None
+
+
+@contextmanager
+def _cache_file_lock():
+    """Exclusive lock on CACHE_FILE across processes (gunicorn workers)."""
+    if fcntl is None:
+        yield
+        return
+    with open(f"{CACHE_FILE}.lock", "wb") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        yield
+
+
+def _schedule_flush() -> None:
+    """Start the flush timer unless one is pending. Must hold _CACHE_LOCK."""
+    global _flush_timer
+    if _flush_timer is None:
+        wait = max(CACHE_FLUSH_INTERVAL - (time.monotonic() - _cache_last_write), 0.0)
+        _flush_timer = threading.Timer(wait, _flush_cache)
+        _flush_timer.daemon = True
+        _flush_timer.start()
+
+
+def _flush_cache() -> None:
+    global _cache_dirty, _cache_last_write, _flush_timer
+    with _FLUSH_LOCK:
+        with _CACHE_LOCK:
+            _flush_timer = None
+            if not _cache_dirty:
+                return
+        try:
+            with _cache_file_lock():
+                # Other workers write the same file: merge their entries
+                # (newest ts wins) so their prices are neither lost nor refetched.
+                on_disk = _load_cache()
+                # Serialize under the cache lock, but do the disk I/O outside
+                # it so lookups and fetches never wait on the file system.
+                with _CACHE_LOCK:
+                    _cache_dirty = False
+                    _cache_last_write = time.monotonic()
+                    for name, entry in on_disk.items():
+                        cur = _CACHE.get(name)
+                        if cur is None or entry["ts"] > cur["ts"]:
+                            _CACHE[name] = entry
+                    data = orjson.dumps(_CACHE, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                tmp = f"{CACHE_FILE}.{os.getpid()}.tmp"
+                with open(tmp, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, CACHE_FILE)
+                return
+        except Exception as exc:
+            print(f"[warn] cache: {CACHE_FILE}: {exc}")
+        # Still dirty; retry on the timer after CACHE_FLUSH_INTERVAL, never
+        # inline, so a persistent failure cannot recurse.
+        with _CACHE_LOCK:
+            _cache_dirty = True
+            _cache_last_write = time.monotonic()
+            _schedule_flush()
+
+
+def _save_cache() -> None:
+    """Mark the cache dirty; the file is written at most every CACHE_FLUSH_INTERVAL.
+
+    The write always happens on the timer thread (immediately when due), so
+    callers such as fetch workers never wait on disk I/O or the file lock.
+    """
+    global _cache_dirty
+    with _CACHE_LOCK:
+        _cache_dirty = True
+        _schedule_flush()
+
+
+atexit.register(_flush_cache)
+
+
+def _json_response(data) -> Response:
+    return Response(orjson.dumps(data), mimetype="application/json")
 
 # ----------------------------- PRICE FETCH -----------------------------
 
-def fetch_price_eur(item_name: str, cache: dict) -> float | None:
-    now = time.time()
-    if (entry := cache.get(item_name)) and now - entry["ts"] < CACHE_TTL:
-        return entry["price_eur"]
+# One pooled session shared by all fetch workers, so connections to
+# steamcommunity.com are kept alive and reused. Transient errors are
+# retried with a short backoff. Retry-After is not honoured here (urllib3
+# would retry 429 and sleep in the worker); _fetch_one turns a 429 into a
+# cooldown instead.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=[500, 502, 503, 504],
+        respect_retry_after_header=False,
+    ),
+))
+
+# Steam rate limits per client IP, so a 429 pauses all fetches until then.
+_cooldown_until = 0.0
+
+# "1,23€" / "1,23 €" / "1,23\xa0€" -> "1.23" in a single pass.
+_PRICE_TABLE = str.maketrans({"€": None, " ": None, "\xa0": None, ",": "."})
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_steam_price(price_raw: str) -> float:
+    return float(price_raw.translate(_PRICE_TABLE))
+
+
+def _retry_after(resp: requests.Response) -> float:
+    try:
+        return max(float(resp.headers.get("Retry-After", "")), 1.0)
+    except ValueError:
+        return STEAM_COOLDOWN
+
+
+def _fetch_one(item_name: str) -> float | None:
+    """HTTP + parse only – does not touch the cache."""
+    global _cooldown_until
+    if (wait := _cooldown_until - time.time()) > 0:
+        print(f"[warn] {item_name}: Steam-Ratelimit, noch {wait:.0f}s Pause")
+        return None
 
     url = (
         "https://steamcommunity.com/market/priceoverview/"
         f"?currency=3&appid=730&market_hash_name={quote(item_name)}"
     )
     try:
-        resp = requests.get(url, timeout=10)
+        resp = _SESSION.get(url, timeout=10)
+        if resp.status_code == 429:
+            _cooldown_until = time.time() + _retry_after(resp)
         resp.raise_for_status()
         data = resp.json()
         price_raw = data.get("lowest_price") or data.get("median_price")
         if not price_raw:
             raise ValueError("keine Preisangabe von Steam erhalten")
-        price_eur = float(price_raw.replace("€", "").replace(" ", "").replace(",", "."))
-        cache[item_name] = {"price_eur": price_eur, "ts": now}
-        return price_eur
+        return _parse_steam_price(price_raw)
     except Exception as exc:
         print(f"[warn] {item_name}: {exc}")
         return None
 
+
+def _store_prices(prices: dict[str, float], ts: float) -> None:
+    if not prices:
+        return
+    with _CACHE_LOCK:
+        for name, price in prices.items():
+            _CACHE[name] = {"price_eur": price, "ts": ts}
+    _save_cache()
+
+
+# All Steam fetches run on one shared pool. A fetch that is already in
+# flight is joined instead of started again, so concurrent requests (and
+# background refreshes) never ask Steam for the same item twice.
+_FETCH_POOL = ThreadPoolExecutor(max_workers=8)
+_INFLIGHT: dict[str, Future] = {}  # guarded by _CACHE_LOCK
+
+
+def _run_fetch(item_name: str, fut: Future) -> None:
+    try:
+        price_eur = _fetch_one(item_name)
+        if price_eur is not None:
+            _store_prices({item_name: price_eur}, time.time())
+    except Exception as exc:
+        fut.set_exception(exc)
+    else:
+        fut.set_result(price_eur)
+    finally:
+        with _CACHE_LOCK:
+            _INFLIGHT.pop(item_name, None)
+
+
+def _fetch_async(item_name: str) -> Future:
+    with _CACHE_LOCK:
+        fut = _INFLIGHT.get(item_name)
+        if fut is None:
+            fut = _INFLIGHT[item_name] = Future()
+            _FETCH_POOL.submit(_run_fetch, item_name, fut)
+    return fut
+
+
+def _lookup(item_name: str, now: float) -> tuple[bool, float | None]:
+    """Return (usable, price) from the cache.
+
+    Fresh entries are returned as is. Stale entries younger than
+    CACHE_TTL * CACHE_STALE_FACTOR are returned too, and a background
+    refresh is scheduled for them (at most one per item). Missing or
+    older entries are not usable and have to be fetched by the caller.
+    """
+    entry = _CACHE.get(item_name)
+    if not entry:
+        return False, None
+    age = now - entry["ts"]
+    if age < CACHE_TTL:
+        return True, entry["price_eur"]
+    if age < CACHE_TTL * CACHE_STALE_FACTOR:
+        _fetch_async(item_name)
+        return True, entry["price_eur"]
+    return False, None
+
+
+def fetch_prices_eur(names: list[str]) -> dict[str, float | None]:
+    """Prices in EUR for names: cached where usable, missing ones fetched concurrently."""
+    now = time.time()
+    prices: dict[str, float | None] = {}
+    missing: list[str] = []
+    for name in names:
+        usable, price = _lookup(name, now)
+        if usable:
+            prices[name] = price
+        else:
+            missing.append(name)
+
+    futures = {name: _fetch_async(name) for name in missing}
+    for name, fut in futures.items():
+        prices[name] = fut.result()
+    return prices
+
+# ----------------------------- SNAPSHOTS -----------------------------
+
+# Full snapshots (items + grand_total) are still written one file each;
+# the chart series lives in the append-only HISTORY_LOG.
+_HISTORY_LOCK = threading.Lock()
+_history_fd: int | None = None
+
+
+def _legacy_history_lines() -> list[bytes]:
+    """One HISTORY_LOG line per snapshot file in SNAPSHOT_DIR, oldest first."""
+    try:
+        with os.scandir(SNAPSHOT_DIR) as it:
+            names = sorted(e.name for e in it if e.name.startswith("csgo_snapshot_") and e.name.endswith(".json"))
+    except FileNotFoundError:
+        return []
+    except OSError as exc:
+        print(f"[warn] history: {SNAPSHOT_DIR}: {exc}")
+        return []
+
+    lines: list[bytes] = []
+    for name in names:
+        path = os.path.join(SNAPSHOT_DIR, name)
+        try:
+            with open(path, "rb") as f:
+                grand_total = orjson.loads(f.read())["grand_total"]
+            ts = name[14:-5]  # YYYYMMDD_HHMMSS
+            if len(ts) != 15 or ts[8] != "_":
+                raise ValueError("unerwarteter Dateiname")
+            ts_fmt = f"{ts[:4]}-{ts[4:6]}-{ts[6:8]} {ts[9:11]}:{ts[11:13]}"
+            lines.append(orjson.dumps({"ts": ts_fmt, "grand_total": grand_total}) + b"\n")
+        except Exception as exc:
+            print(f"[warn] history: {path}: {exc}")
+    return lines
+
+
+def _seed_history_log() -> bool:
+    """Create HISTORY_LOG, seeded from legacy snapshot files, if it does not exist yet.
+
+    O_EXCL makes sure exactly one process (gunicorn worker) creates the log.
+    It is never replaced afterwards, so append descriptors held by other
+    workers stay valid. Returns whether the log exists; False if
+    SNAPSHOT_DIR is missing or not writable. Must be called with
+    _HISTORY_LOCK held.
+    """
+    if os.path.exists(HISTORY_LOG):
+        return True
+    if not os.path.isdir(SNAPSHOT_DIR):
+        return False
+
+    lines = _legacy_history_lines()
+    try:
+        fd = os.open(HISTORY_LOG, os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        return True  # another worker got there first
+    except OSError as exc:
+        print(f"[warn] history: {HISTORY_LOG}: {exc}")
+        return False
+    try:
+        with os.fdopen(fd, "ab") as f:
+            f.write(b"".join(lines))
+    except OSError as exc:
+        print(f"[warn] history: {HISTORY_LOG}: {exc}")
+    return True
+
+
+def _history_from_lines(lines, source: str) -> dict[str, list]:
+    ts_arr: list[str] = []
+    gt_arr: list[float] = []
+    for line in lines:
+        try:
+            row = orjson.loads(line)
+            ts, grand_total = row["ts"], row["grand_total"]
+        except (orjson.JSONDecodeError, KeyError, TypeError) as exc:
+            print(f"[warn] history: {source}: {exc}")
+            continue
+        ts_arr.append(ts)
+        gt_arr.append(grand_total)
+    # Lines are appended in time order; only re-sort if they are not.
+    if any(a > b for a, b in zip(ts_arr, ts_arr[1:])):
+        pairs = sorted(zip(ts_arr, gt_arr), key=lambda p: p[0])
+        ts_arr = [ts for ts, _ in pairs]
+        gt_arr = [gt for _, gt in pairs]
+    return {"ts": ts_arr, "grand_total": gt_arr}
+
+
+def _append_history(line: bytes) -> None:
+    global _history_fd
+    with _HISTORY_LOCK:
+        if _history_fd is None:
+            os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+            _seed_history_log()
+            _history_fd = os.open(HISTORY_LOG, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        os.write(_history_fd, line)
+
+
+def _write_snapshot(filepath: str, data_bytes: bytes, history_line: bytes) -> None:
+    try:
+        # Append first: if the log still has to be seeded from the snapshot
+        # files, the new snapshot must not be among them yet.
+        _append_history(history_line)
+        tmp = f"{filepath}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data_bytes)
+        os.replace(tmp, filepath)
+    except Exception as exc:
+        print(f"[warn] snapshot: {filepath}: {exc}")
+
 # ----------------------------- API ENDPOINTS -----------------------------
 
+# INVENTORY is fixed, so its views are built once instead of per request.
+_INV_ITEMS: list[tuple[str, int]] = list(INVENTORY.items())
+_INV_NAMES: list[str] = [name for name, _ in _INV_ITEMS]
+
+
 @app.route("/api/prices")
 def api_prices():
-    cache = _load_cache()
+    prices = fetch_prices_eur(_INV_NAMES)
     items: list[dict] = []
     grand_total = 0.0
 
-    for name, count in INVENTORY.items():
-        price = fetch_price_eur(name, cache)
+    for name, count in _INV_ITEMS:
+        price = prices[name]
         total = round(price * count, 2) if price is not None else None
         if total is not None:
             grand_total += total
         items.append({"name": name, "count": count, "price": price, "total": total})
 
-    _save_cache(cache)
-
     resp_data = {"items": items, "grand_total": round(grand_total, 2)}
     if request.args.get("store") == "1":
-        os.makedirs(SNAPSHOT_DIR, exist_ok=True)
-        filename  = f"csgo_snapshot_{time.strftime('%Y%m%d_%H%M%S')}.json"
+        now = time.localtime()
+        filename  = f"csgo_snapshot_{time.strftime('%Y%m%d_%H%M%S', now)}.json"
         filepath  = os.path.join(SNAPSHOT_DIR, filename)
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(resp_data, f, ensure_ascii=False, indent=2)
+        data_bytes = orjson.dumps(resp_data, option=orjson.OPT_INDENT_2)
+        history_line = orjson.dumps({
+            "ts": time.strftime("%Y-%m-%d %H:%M", now),
+            "grand_total": resp_data["grand_total"],
+        }) + b"\n"
+        # Disk I/O happens off the request thread; saved is reported optimistically.
+        threading.Thread(
+            target=_write_snapshot, args=(filepath, data_bytes, history_line), daemon=True
+        ).start()
         resp_data.update({"saved": True, "filename": filename})
 
-    return jsonify(resp_data)
+    resp = _json_response(resp_data)
+    if request.args.get("store") == "1" or request.args.get("nocache") == "1":
+        resp.headers["Cache-Control"] = "no-store"
+    else:
+        resp.headers["Cache-Control"] = API_CACHE_CONTROL
+    return resp
+
+
+# (etag, {"ts": [...], "grand_total": [...]}) of the last HISTORY_LOG read.
+_HIST_CACHE: tuple[str, dict[str, list]] | None = None
 
 
 @app.route("/api/history")
 def api_history():
-    history: list[dict] = []
-    for path in sorted(glob.glob(SNAPSHOT_GLOB)):
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            ts_str = os.path.basename(path)[len("csgo_snapshot_"):-5]
-            ts = datetime.strptime(ts_str, "%Y%m%d_%H%M%S")
-            history.append({"ts": ts.strftime("%Y-%m-%d %H:%M"), "grand_total": data["grand_total"]})
-        except Exception as exc:
-            print(f"[warn] history: {path}: {exc}")
-    return jsonify({"history": history})
+    global _HIST_CACHE
+    with _HISTORY_LOCK:
+        has_log = _seed_history_log()
+    if not has_log:
+        # No log and none can be created (e.g. read-only snapshot directory):
+        # build the series from the snapshot files, as before the log existed.
+        resp = _json_response(_history_from_lines(_legacy_history_lines(), SNAPSHOT_DIR))
+        resp.headers["Cache-Control"] = "no-cache"
+        return resp
+
+    try:
+        st = os.stat(HISTORY_LOG)
+        size, mtime = st.st_size, st.st_mtime
+    except OSError:
+        size, mtime = 0, 0.0
+
+    # The log is append-only, so (size, mtime) identifies its content.
+    etag = f'"{size}-{int(mtime)}"'
+    # Always revalidate: a new snapshot must show up at once, and the
+    # ETag makes the unchanged case a cheap 304.
+    if request.headers.get("If-None-Match") == etag:
+        return Response(status=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+    if _HIST_CACHE and _HIST_CACHE[0] == etag:
+        history = _HIST_CACHE[1]
+    else:
+        history = _history_from_lines([], HISTORY_LOG)
+        if size:
+            try:
+                with open(HISTORY_LOG, "rb") as f:
+                    history = _history_from_lines(f, HISTORY_LOG)
+            except OSError as exc:
+                print(f"[warn] history: {HISTORY_LOG}: {exc}")
+        _HIST_CACHE = (etag, history)
+
+    resp = _json_response(history)
+    resp.headers["ETag"] = etag
+    resp.headers["Cache-Control"] = "no-cache"
+    return resp
 
 # ----------------------------- FRONTEND -----------------------------
 HTML_TEMPLATE = """<!doctype html>
@@ -203,6 +571,7 @@ HTML_TEMPLATE = """<!doctype html>
 
   <div class=\"d-flex gap-2 mb-4\">
     <button class=\"btn btn-primary\" onclick=\"loadData()\">🔄 Aktualisieren</button>
+    <button class=\"btn btn-outline-primary\" onclick=\"loadData(true)\">⚡ Neu laden (ohne Cache)</button>
     <button class=\"btn btn-success\" onclick=\"saveSnapshot()\">💾 Snapshot speichern</button>
   </div>
 
@@ -221,9 +590,27 @@ function fmtEUR(x){
   return x===null? '—' : x.toLocaleString('de-DE', {minimumFractionDigits:2}) + ' €';
 }
 
-async function loadData(){
-  const res = await fetch('/api/prices');
+// Prices are kept in localStorage for CLIENT_TTL; force skips all caches.
+const CLIENT_TTL = 60000;
+
+async function fetchPrices(force){
+  if(!force){
+    try{
+      const hit = JSON.parse(localStorage.getItem('prices_v1'));
+      if(hit && Date.now() - hit.ts < CLIENT_TTL){ return hit.data; }
+    }catch(e){}
+  }
+  const res = await fetch(force ? '/api/prices?nocache=1' : '/api/prices');
   const data = await res.json();
+  // Stamp with the server's Date header: the browser may have answered from
+  // its HTTP cache (stale-while-revalidate), so the body can be older than now.
+  const served = Date.parse(res.headers.get('Date'));
+  try{ localStorage.setItem('prices_v1', JSON.stringify({ts: isNaN(served) ? Date.now() : served, data: data})); }catch(e){}
+  return data;
+}
+
+async function loadData(force){
+  const data = await fetchPrices(force);
 
   // --- update table ---
   const tbody = document.querySelector('#casesTbl tbody');
@@ -260,10 +647,10 @@ let histChart = null;
 async function loadHistory(){
   const res = await fetch('/api/history');
   const data = await res.json();
-  if(!data.history.length){return;}
+  if(!data.ts.length){return;}
 
-  const labels = data.history.map(h => new Date(h.ts.replace(' ', 'T')+':00'));
-  const values = data.history.map(h => h.grand_total);
+  const labels = data.ts.map(s => new Date(s.replace(' ', 'T')+':00'));
+  const values = data.grand_total;
   const deltas = values.map((v,i)=> i ? v - values[i-1] : null);
   const gaps   = labels.map((ts,i)=> i ? (ts - labels[i-1]) / 60000 : null);
 
@@ -312,12 +699,30 @@ window.addEventListener('DOMContentLoaded', ()=>{ loadData(); });
 </body>
 </html>"""
 
+# The template uses no Jinja substitutions, so the page is encoded once and
+# served as is. If variables are ever needed, compile it once with
+# app.jinja_env.from_string(HTML_TEMPLATE) and .render() per request.
+_INDEX_BYTES = HTML_TEMPLATE.encode("utf-8")
+_INDEX_GZIP = gzip.compress(_INDEX_BYTES, compresslevel=9, mtime=0)
+
 # ----------------------------- ROUTES -----------------------------
 
 @app.route("/")
 def index():
-    return render_template_string(HTML_TEMPLATE)
+    if request.accept_encodings["gzip"]:
+        resp = Response(_INDEX_GZIP, mimetype="text/html")
+        resp.headers["Content-Encoding"] = "gzip"
+    else:
+        resp = Response(_INDEX_BYTES, mimetype="text/html")
+    resp.headers["Vary"] = "Accept-Encoding"
+    resp.headers["Cache-Control"] = "public, max-age=300"
+    return resp
 
 # ----------------------------- MAIN -----------------------------
+# Production: gunicorn -w 2 -k gthread --threads 8 -b 0.0.0.0:$PORT csgo_case_calculator:app
+# Each worker keeps its own in-memory price cache and merges it with
+# price_cache.json on flush (under an fcntl lock). history.jsonl is created
+# exactly once and only appended to, so workers can share it. Without
+# fcntl (Windows) run a single process.
 if __name__ == "__main__":
-    app.run(debug=True, port=int(os.getenv("PORT", 5000)))
+    app.run(debug=False, threaded=True, port=int(os.getenv("PORT", 5000)))